@@ -0,0 +1,40 @@
+import json
+import os
+
+os.environ.setdefault("SLACK_BOT_TOKEN", "xoxb-test")
+os.environ.setdefault("SLACK_SIGNING_SECRET", "test")
+
+import pytest
+
+import viewing_bot
+
+SELECT_MODALS = [viewing_bot.UNBOOKING_MODAL, viewing_bot.EXTENDING_MODAL]
+
+
+@pytest.mark.parametrize("modal_template", SELECT_MODALS)
+def test_build_select_modal_leaves_template_untouched(modal_template):
+    options = [
+        {
+            "text": {"type": "plain_text", "text": "Review - October 17: 10:00"},
+            "value": "1",
+        }
+    ]
+
+    view = viewing_bot.build_select_modal(modal_template, options)
+
+    assert view["blocks"][0]["element"]["options"] == options
+    assert modal_template["blocks"][0]["element"]["options"] == ()
+    assert len(view["blocks"]) == len(modal_template["blocks"])
+    json.dumps(view)
+
+
+@pytest.mark.parametrize("modal_template", SELECT_MODALS)
+def test_select_modal_template_is_frozen(modal_template):
+    with pytest.raises(TypeError):
+        modal_template["blocks"][0]["element"]["options"] = []
+
+    with pytest.raises(TypeError):
+        modal_template["blocks"][0] = {}
+
+    with pytest.raises(TypeError):
+        modal_template["blocks"] = []
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import functools
 import os
-import sqlite3
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
+from types import MappingProxyType
+from zoneinfo import ZoneInfo
 
-import pytz
+import aiosqlite
+import orjson
 import websockets
 from dotenv import load_dotenv
 from slack_bolt.adapter.socket_mode.aiohttp import AsyncSocketModeHandler
@@ -16,26 +18,113 @@ from slack_bolt.async_app import AsyncApp
 
 load_dotenv()
 SCRIPT_LOCATION: Path = Path(__file__).parent
-DATABASE_CONNECTION = sqlite3.connect(
-    SCRIPT_LOCATION / "viewing_bookings.db", check_same_thread=False
+DATABASE_PATH: Path = SCRIPT_LOCATION / "viewing_bookings.db"
+DATABASE_CONNECTION: aiosqlite.Connection | None = None
+READ_DATABASE_CONNECTION: aiosqlite.Connection | None = None
+CONNECTED_SCREENS: set[websockets.WebSocketServerProtocol] = set()
+LAST_SCREEN_PAYLOAD: str | None = None
+BOOKINGS_CHANGED = asyncio.Event()
+
+WRITE_DATABASE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
 )
+READ_DATABASE_PRAGMAS = (
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+)
+
+# The unary + on start_time keeps SQLite from picking the start_time index for these
+# checks, so they seek on end_time and skip every booking that has already finished.
+SQL_OVERLAP = """
+    SELECT description FROM bookings
+    WHERE +start_time <= ? AND end_time >= ?
+    LIMIT 1
+"""
+SQL_INSERT_BOOKING = """
+    INSERT INTO bookings (start_time, end_time, description, user_id)
+    SELECT ?, ?, ?, ?
+    WHERE NOT EXISTS (
+        SELECT 1 FROM bookings WHERE +start_time <= ? AND end_time >= ?
+    )
+"""
+SQL_DELETE_BOOKING = "DELETE FROM bookings WHERE id = ?"
+SQL_BOOKING_EXISTS = "SELECT 1 FROM bookings WHERE id = ?"
+SQL_EXTEND_BOOKING = """
+    UPDATE bookings SET end_time = end_time + ?
+    WHERE id = ? AND NOT EXISTS (
+        SELECT 1 FROM bookings AS other
+        WHERE other.id != bookings.id
+        AND +other.start_time <= bookings.end_time + ?
+        AND other.end_time >= bookings.start_time
+    )
+"""
+SQL_USER_FUTURE = """
+    SELECT id, start_time, end_time, description FROM bookings
+    WHERE user_id = ? AND end_time > ? ORDER BY start_time ASC
+"""
+SQL_WEEK = """
+    SELECT id, start_time, end_time, description FROM bookings
+    WHERE start_time BETWEEN ? AND ? ORDER BY start_time ASC
+"""
+SQL_CURRENT_THREE = """
+    SELECT id, start_time, end_time, description FROM bookings
+    WHERE end_time >= ? AND +start_time <= ? ORDER BY start_time ASC LIMIT 3
+"""
+AMSTERDAM = ZoneInfo("Europe/Amsterdam")
+
+BOOKING_START_TIME_KEYS = ("booking_datetime", "booking_datetime", "selected_date_time")
+BOOKING_DURATION_KEYS = (
+    "booking_duration",
+    "booking_duration",
+    "selected_option",
+    "value",
+)
+BOOKING_DESCRIPTION_KEYS = ("booking_description", "booking_description", "value")
+UNBOOKING_ID_KEYS = ("unbooking_select", "unbooking_action", "selected_option", "value")
+EXTENDING_ID_KEYS = ("extending_select", "extending_action", "selected_option", "value")
+EXTENDING_DURATION_KEYS = (
+    "extending_duration",
+    "extending_duration",
+    "selected_option",
+    "value",
+)
+
+
+def load_modal_template(file_name: str) -> MappingProxyType:
+    """Loads a modal template and freezes the parts that our handlers fill in.
+    Views are built by merging over the template, so the template itself never changes.
+
+    Args:
+        file_name: Name of the modal JSON file
+
+    Returns:
+        Read-only modal template
+    """
+    modal = orjson.loads((SCRIPT_LOCATION / "modals" / file_name).read_bytes())
+    blocks = modal["blocks"]
+    if blocks and "element" in blocks[0]:
+        element = blocks[0]["element"]
+        element = MappingProxyType(element | {"options": tuple(element["options"])})
+        blocks[0] = MappingProxyType(blocks[0] | {"element": element})
+    modal["blocks"] = tuple(blocks)
+    return MappingProxyType(modal)
+
 
 booking_modal_json = (SCRIPT_LOCATION / "modals" / "booking_modal.json").read_text()
 
-unbooking_modal_json = (SCRIPT_LOCATION / "modals" / "unbooking_modal.json").read_text()
-UNBOOKING_MODAL = json.loads(unbooking_modal_json)
+UNBOOKING_MODAL = load_modal_template("unbooking_modal.json")
 
-extending_modal_json = (SCRIPT_LOCATION / "modals" / "extending_modal.json").read_text()
-EXTENDING_MODAL = json.loads(extending_modal_json)
+EXTENDING_MODAL = load_modal_template("extending_modal.json")
 
 no_bookings_modal_json = (
     SCRIPT_LOCATION / "modals" / "no_bookings_modal.json"
 ).read_text()
 
-bookings_list_modal = (
-    SCRIPT_LOCATION / "modals" / "bookings_list_modal.json"
-).read_text()
-BOOKINGS_MODAL = json.loads(bookings_list_modal)
+BOOKINGS_MODAL = load_modal_template("bookings_list_modal.json")
 
 app = AsyncApp(token=os.getenv("SLACK_BOT_TOKEN"))
 WEBSOCKET_PORT = os.getenv("WEBSOCKET_PORT")
@@ -87,7 +176,7 @@ async def process_booking(ack, body, client, view) -> None:
     )
 
     try:
-        await add_booking(booking_information)
+        await check_booking_overlap(booking_information)
     except OverlappingBookingError as error_message:
         errors = {"booking_datetime": str(error_message)}
         await ack(response_action="errors", errors=errors)
@@ -95,7 +184,16 @@ async def process_booking(ack, body, client, view) -> None:
 
     await ack()
 
-    human_readable_time = await get_readable_time_from_unix_time(
+    try:
+        await add_booking(booking_information)
+    except OverlappingBookingError as error_message:
+        await client.chat_postMessage(
+            channel=body["user"]["id"],
+            text=f"Could not book viewing. {error_message}",
+        )
+        return
+
+    human_readable_time = get_readable_time_from_unix_time(
         booking_information["start_time"]
     )
     await client.chat_postMessage(
@@ -114,17 +212,15 @@ async def process_unbooking(ack, body, client, view) -> None:
         client: Slack client
         view: Slack view
     """
-    unbooking_id = int(
-        view["state"]["values"]["unbooking_select"]["unbooking_action"][
-            "selected_option"
-        ]["value"]
-    )
+    await ack()
 
-    DATABASE_CONNECTION.execute("DELETE FROM bookings WHERE id = ?", (unbooking_id,))
+    unbooking_id = int(get_nested_value(view["state"]["values"], UNBOOKING_ID_KEYS))
 
-    DATABASE_CONNECTION.commit()
+    async with DATABASE_CONNECTION.execute(SQL_DELETE_BOOKING, (unbooking_id,)):
+        pass
 
-    await ack()
+    await DATABASE_CONNECTION.commit()
+    BOOKINGS_CHANGED.set()
 
     await client.chat_postMessage(
         channel=body["user"]["id"],
@@ -142,41 +238,32 @@ async def process_extending(ack, body, client, view) -> None:
         client: Slack client
         view: Slack view
     """
-    extending_id = int(
-        view["state"]["values"]["extending_select"]["extending_action"][
-            "selected_option"
-        ]["value"]
-    )
+    view_state_values = view["state"]["values"]
+    extending_id = int(get_nested_value(view_state_values, EXTENDING_ID_KEYS))
     extension_in_seconds = (
-        int(
-            view["state"]["values"]["extending_duration"]["extending_duration"][
-                "selected_option"
-            ]["value"]
-        )
-        * 60
+        int(get_nested_value(view_state_values, EXTENDING_DURATION_KEYS)) * 60
     )
 
-    cursor = DATABASE_CONNECTION.cursor()
-    cursor.execute("SELECT * FROM bookings WHERE id = ?", (extending_id,))
-    booking = cursor.fetchone()
-
-    if booking is None:
-        await ack(
-            response_action="errors", errors={"extending_select": "Booking not found."}
-        )
-        return
-
-    new_end_time = booking[2] + extension_in_seconds
-    cursor.execute(
-        """
-        SELECT * FROM bookings
-        WHERE id != ? AND NOT (start_time >= ? OR end_time <= ?)
-        """,
-        (extending_id, new_end_time, booking[1]),
-    )
-    overlapping_booking = cursor.fetchone()
+    async with DATABASE_CONNECTION.execute(
+        SQL_EXTEND_BOOKING,
+        (extension_in_seconds, extending_id, extension_in_seconds),
+    ) as cursor:
+        extended = cursor.rowcount > 0
+    await DATABASE_CONNECTION.commit()
+
+    if not extended:
+        async with DATABASE_CONNECTION.execute(
+            SQL_BOOKING_EXISTS, (extending_id,)
+        ) as cursor:
+            booking_exists = await cursor.fetchone() is not None
+
+        if not booking_exists:
+            await ack(
+                response_action="errors",
+                errors={"extending_select": "Booking not found."},
+            )
+            return
 
-    if overlapping_booking:
         await ack(
             response_action="errors",
             errors={
@@ -185,11 +272,7 @@ async def process_extending(ack, body, client, view) -> None:
         )
         return
 
-    cursor.execute(
-        "UPDATE bookings SET end_time = ? WHERE id = ?", (new_end_time, extending_id)
-    )
-    DATABASE_CONNECTION.commit()
-
+    BOOKINGS_CHANGED.set()
     await ack()
 
     await client.chat_postMessage(
@@ -233,8 +316,7 @@ async def send_unbook_interface(client, command, user_id: str) -> None:
     if user_bookings:
         input_options = await bookings_to_slack_options(user_bookings)
 
-        new_unbooking_modal = UNBOOKING_MODAL
-        new_unbooking_modal["blocks"][0]["element"]["options"] = input_options
+        new_unbooking_modal = build_select_modal(UNBOOKING_MODAL, input_options)
 
         await client.views_open(
             trigger_id=command["trigger_id"], view=new_unbooking_modal
@@ -259,8 +341,7 @@ async def send_extend_interface(client, command, user_id: str) -> None:
     if user_bookings:
         input_options = await bookings_to_slack_options(user_bookings)
 
-        new_extending_modal = EXTENDING_MODAL
-        new_extending_modal["blocks"][0]["element"]["options"] = input_options
+        new_extending_modal = build_select_modal(EXTENDING_MODAL, input_options)
 
         await client.views_open(
             trigger_id=command["trigger_id"], view=new_extending_modal
@@ -272,6 +353,27 @@ async def send_extend_interface(client, command, user_id: str) -> None:
     )
 
 
+def build_select_modal(modal_template: MappingProxyType, input_options: list) -> dict:
+    """Builds a view from a modal template whose first block is a select menu.
+    Only the select menu path is copied, the template itself is left untouched.
+
+    Args:
+        modal_template: Modal template with a select menu as first block
+        input_options: Slack Block Kit options for the select menu
+
+    Returns:
+        View with the options filled in
+    """
+    select_block = modal_template["blocks"][0]
+    return modal_template | {
+        "blocks": [
+            select_block
+            | {"element": select_block["element"] | {"options": input_options}},
+            *modal_template["blocks"][1:],
+        ]
+    }
+
+
 async def send_bookings_list_interface(client, command) -> None:
     """Sends a list of bookings items for the next week to the client.
 
@@ -282,8 +384,7 @@ async def send_bookings_list_interface(client, command) -> None:
     coming_week_bookings = await get_coming_week_bookings()
     blocks = await bookings_to_slack_list(coming_week_bookings)
 
-    new_bookings_list_modal = BOOKINGS_MODAL
-    new_bookings_list_modal["blocks"] = blocks
+    new_bookings_list_modal = BOOKINGS_MODAL | {"blocks": blocks}
 
     await client.views_open(
         trigger_id=command["trigger_id"], view=new_bookings_list_modal
@@ -301,67 +402,83 @@ async def sanitize_booking_input(
     Returns:
         booking_information: Dict of relevant booking information
     """
-    booking_information = {}
-    booking_information["start_time"] = view_state_values["booking_datetime"][
-        "booking_datetime"
-    ]["selected_date_time"]
-
-    booking_information["duration"] = int(
-        view_state_values["booking_duration"]["booking_duration"]["selected_option"][
-            "value"
-        ]
-    )
+    start_time = get_nested_value(view_state_values, BOOKING_START_TIME_KEYS)
+    duration = int(get_nested_value(view_state_values, BOOKING_DURATION_KEYS))
+
+    return {
+        "start_time": start_time,
+        "duration": duration,
+        "end_time": (start_time + duration * 60) - 1,
+        "description": get_nested_value(view_state_values, BOOKING_DESCRIPTION_KEYS),
+        "user_id": user_id,
+    }
 
-    booking_information["end_time"] = (
-        booking_information["start_time"] + booking_information["duration"] * 60
-    ) - 1
 
-    booking_information["description"] = view_state_values["booking_description"][
-        "booking_description"
-    ]["value"]
+def get_nested_value(dictionary: dict, keys: tuple[str, ...]):
+    """Looks up a value in nested dictionaries by following the given keys.
 
-    booking_information["user_id"] = user_id
+    Args:
+        dictionary: Outer dictionary, like the view state values
+        keys: Keys to follow, from outer to inner
 
-    return booking_information
+    Returns:
+        The value found at the end of the keys
+    """
+    for key in keys:
+        dictionary = dictionary[key]
+    return dictionary
 
 
-async def add_booking(booking_information: dict) -> None:
-    """Adds the reservation to the booking database.
+async def check_booking_overlap(booking_information: dict) -> None:
+    """Checks if the reservation overlaps with a booking in the database.
 
     Args:
-        booking_information (dict): _description_
+        booking_information: Dict of relevant booking information
 
     Raises:
         OverlappingBookingError: Error when booking overlaps another one.
     """
-    cursor = DATABASE_CONNECTION.cursor()
-    cursor.execute(
-        """
-        SELECT * FROM bookings
-        WHERE NOT (start_time >= ? OR end_time <= ?)
-        """,
+    async with DATABASE_CONNECTION.execute(
+        SQL_OVERLAP,
         (booking_information["end_time"], booking_information["start_time"]),
-    )
-    existing_booking = cursor.fetchone()
+    ) as cursor:
+        existing_booking = await cursor.fetchone()
 
     if existing_booking:
-        error_message = f"A booking called '{existing_booking[3]}' already exists during that time slot!"
+        error_message = f"A booking called '{existing_booking[0]}' already exists during that time slot!"
         raise OverlappingBookingError(error_message)
 
-    cursor.execute(
-        """
-            INSERT INTO bookings (start_time, end_time, description, user_id)
-            VALUES (?, ?, ?, ?)
-        """,
+
+async def add_booking(booking_information: dict) -> None:
+    """Adds the reservation to the booking database.
+
+    Args:
+        booking_information (dict): _description_
+
+    Raises:
+        OverlappingBookingError: Error when booking overlaps another one.
+    """
+    async with DATABASE_CONNECTION.execute(
+        SQL_INSERT_BOOKING,
         (
             booking_information["start_time"],
             booking_information["end_time"],
             booking_information["description"],
             booking_information["user_id"],
+            booking_information["end_time"],
+            booking_information["start_time"],
         ),
-    )
+    ) as cursor:
+        added = cursor.rowcount > 0
+    await DATABASE_CONNECTION.commit()
+
+    if not added:
+        await check_booking_overlap(booking_information)
+        raise OverlappingBookingError(
+            "Another booking already exists during that time slot!"
+        )
 
-    DATABASE_CONNECTION.commit()
+    BOOKINGS_CHANGED.set()
 
 
 async def get_all_future_user_bookings(user_id: str) -> dict:
@@ -374,14 +491,11 @@ async def get_all_future_user_bookings(user_id: str) -> dict:
         All future bookings from user
     """
     current_time = int(time.time())
-    cursor = DATABASE_CONNECTION.cursor()
-    cursor.execute(
-        """
-        SELECT * FROM bookings WHERE user_id = ? AND end_time > ? ORDER BY start_time ASC
-    """,
+    async with READ_DATABASE_CONNECTION.execute(
+        SQL_USER_FUTURE,
         (user_id, current_time),
-    )
-    return cursor.fetchall()
+    ) as cursor:
+        return await cursor.fetchall()
 
 
 async def get_coming_week_bookings() -> dict:
@@ -396,14 +510,11 @@ async def get_coming_week_bookings() -> dict:
     today_start_timestamp = int(today_start.timestamp())
     one_week_later_timestamp = int(one_week_later.timestamp())
 
-    cursor = DATABASE_CONNECTION.cursor()
-    cursor.execute(
-        """
-        SELECT * FROM bookings WHERE start_time >= ? AND start_time <= ? ORDER BY start_time ASC
-        """,
+    async with READ_DATABASE_CONNECTION.execute(
+        SQL_WEEK,
         (today_start_timestamp, one_week_later_timestamp),
-    )
-    return cursor.fetchall()
+    ) as cursor:
+        return await cursor.fetchall()
 
 
 async def get_current_three_bookings() -> dict:
@@ -417,14 +528,11 @@ async def get_current_three_bookings() -> dict:
         datetime.now().replace(hour=23, minute=59, second=59, microsecond=0).timestamp()
     )
 
-    cursor = DATABASE_CONNECTION.cursor()
-    cursor.execute(
-        """
-        SELECT * FROM bookings WHERE end_time >= ? AND start_time <= ? ORDER BY start_time ASC LIMIT 3
-        """,
+    async with READ_DATABASE_CONNECTION.execute(
+        SQL_CURRENT_THREE,
         (current_timestamp, today_end_timestamp),
-    )
-    return cursor.fetchall()
+    ) as cursor:
+        return await cursor.fetchall()
 
 
 async def bookings_to_slack_options(bookings: list) -> list:
@@ -438,8 +546,8 @@ async def bookings_to_slack_options(bookings: list) -> list:
     """
     options = []
     for booking in bookings:
-        booking_id, start_time, _, description, _ = booking
-        readable_start_time = await get_readable_time_from_unix_time(start_time)
+        booking_id, start_time, _, description = booking
+        readable_start_time = get_readable_time_from_unix_time(start_time)
 
         option = {
             "text": {
@@ -464,20 +572,14 @@ async def bookings_to_slack_list(bookings: list) -> list:
         A list of dictionaries formatted for Slack Block Kit's blocks field.
     """
     blocks = []
-    amsterdam = pytz.timezone("Europe/Amsterdam")
     last_date = None
 
     for booking in bookings:
-        _, start_time, end_time, description, _ = booking
+        _, start_time, end_time, description = booking
 
-        start_time_datetime = (
-            datetime.utcfromtimestamp(start_time)
-            .replace(tzinfo=pytz.utc)
-            .astimezone(amsterdam)
-        )
-        date_string = start_time_datetime.strftime("%B %d")
+        date_string = datetime.fromtimestamp(start_time, AMSTERDAM).strftime("%B %d")
 
-        start_time_string, end_time_string = await get_readable_start_end_time(
+        start_time_string, end_time_string = get_readable_start_end_time(
             start_time, end_time
         )
 
@@ -512,11 +614,14 @@ async def bookings_to_slack_list(bookings: list) -> list:
     return blocks
 
 
-async def bookings_to_view_json(current_three_bookings: list) -> str:
+async def bookings_to_view_json(
+    current_three_bookings: list, current_timestamp: int
+) -> str:
     """Turns three bookings into a nice JSON for use in our viewer.
 
     Args:
         current_three_bookings: List of current three bookings
+        current_timestamp: Unix time used to decide which booking is going on
 
     Returns:
         JSON of booking information
@@ -528,17 +633,17 @@ async def bookings_to_view_json(current_three_bookings: list) -> str:
     }
 
     if not current_three_bookings:
-        return json.dumps(booking_information)
+        return orjson.dumps(booking_information).decode()
 
     for booking in current_three_bookings:
-        _, start_time, end_time, description, _ = booking
-        current_timestamp = int(datetime.now().timestamp())
-        start_time_string, end_time_string = await get_readable_start_end_time(
+        _, start_time, end_time, description = booking
+        start_time_string, end_time_string = get_readable_start_end_time(
             start_time, end_time
         )
 
-        if not booking_information["current_booking"] and current_timestamp in range(
-            start_time, end_time
+        if (
+            booking_information["current_booking"] is None
+            and is_current_booking(start_time, end_time, current_timestamp)
         ):
             booking_information["current_booking"] = {
                 "time": f"{start_time_string} - {end_time_string}",
@@ -560,12 +665,25 @@ async def bookings_to_view_json(current_three_bookings: list) -> str:
             }
             continue
 
-    return json.dumps(booking_information)
+    return orjson.dumps(booking_information).decode()
 
 
-async def get_readable_start_end_time(
-    start_time: int, end_time: int
-) -> tuple[str, str]:
+def is_current_booking(start_time: int, end_time: int, current_timestamp: int) -> bool:
+    """Checks if a booking is going on at the given time.
+
+    Args:
+        start_time: Start time
+        end_time: End time
+        current_timestamp: Unix time to check
+
+    Returns:
+        Whether the booking is going on
+    """
+    return start_time <= current_timestamp < end_time
+
+
+@functools.lru_cache(maxsize=4096)
+def get_readable_start_end_time(start_time: int, end_time: int) -> tuple[str, str]:
     """Turns the start and end time integers into readable strings.
 
     Args:
@@ -576,24 +694,15 @@ async def get_readable_start_end_time(
         start_time_string: H:M notation of time
         end_time_string: H:M notation of time
     """
-    amsterdam = pytz.timezone("Europe/Amsterdam")
-
-    start_time_datetime = (
-        datetime.utcfromtimestamp(start_time)
-        .replace(tzinfo=pytz.utc)
-        .astimezone(amsterdam)
-    )
-    end_time_datetime = (
-        datetime.utcfromtimestamp(end_time + 1)
-        .replace(tzinfo=pytz.utc)
-        .astimezone(amsterdam)
-    )
+    start_time_datetime = datetime.fromtimestamp(start_time, AMSTERDAM)
+    end_time_datetime = datetime.fromtimestamp(end_time + 1, AMSTERDAM)
     start_time_string = start_time_datetime.strftime("%H.%M")
     end_time_string = end_time_datetime.strftime("%H.%M")
     return start_time_string, end_time_string
 
 
-async def get_readable_time_from_unix_time(unix_time: int) -> str:
+@functools.lru_cache(maxsize=4096)
+def get_readable_time_from_unix_time(unix_time: int) -> str:
     """Creates a readable string from unix time.
 
     Args:
@@ -602,51 +711,139 @@ async def get_readable_time_from_unix_time(unix_time: int) -> str:
     Returns:
         Human readable time string
     """
-    amsterdam = pytz.timezone("Europe/Amsterdam")
-    start_time_datetime = (
-        datetime.utcfromtimestamp(unix_time)
-        .replace(tzinfo=pytz.utc)
-        .astimezone(amsterdam)
-    )
+    start_time_datetime = datetime.fromtimestamp(unix_time, AMSTERDAM)
     return start_time_datetime.strftime("%B %d: %H:%M")
 
 
+async def open_database_connection() -> None:
+    """Opens the writing connection to the bookings database."""
+    global DATABASE_CONNECTION
+    DATABASE_CONNECTION = await aiosqlite.connect(DATABASE_PATH, cached_statements=256)
+
+
+async def open_read_database_connection() -> None:
+    """Opens a read-only connection to the bookings database.
+    Used by the queries that only read bookings, so they don't have to share a connection with the writes.
+    """
+    global READ_DATABASE_CONNECTION
+    READ_DATABASE_CONNECTION = await aiosqlite.connect(
+        f"{DATABASE_PATH.resolve().as_uri()}?mode=ro",
+        uri=True,
+        cached_statements=256,
+    )
+    await execute_statements(READ_DATABASE_CONNECTION, READ_DATABASE_PRAGMAS)
+
+
+async def close_database_connections() -> None:
+    """Closes the database connections.
+    Their worker threads keep the program from exiting until they are closed.
+    """
+    for connection in (READ_DATABASE_CONNECTION, DATABASE_CONNECTION):
+        if connection is not None:
+            await connection.close()
+
+
+async def execute_statements(
+    connection: aiosqlite.Connection, statements: tuple[str, ...]
+) -> None:
+    """Runs statements that don't return rows, closing each cursor right away.
+
+    Args:
+        connection: Database connection to run the statements on
+        statements: SQL statements to run in order
+    """
+    for statement in statements:
+        async with connection.execute(statement):
+            pass
+
+
 async def create_bookings_table() -> None:
     """Creates a bookings table in the database if it does not already exist."""
-    DATABASE_CONNECTION.execute(
-        """
-        CREATE TABLE IF NOT EXISTS bookings (
-            id INTEGER PRIMARY KEY,
-            start_time INTEGER NOT NULL,
-            end_time INTEGER NOT NULL,
-            description TEXT NOT NULL,
-            user_id TEXT NOT NULL
-        )
-    """
+    await execute_statements(DATABASE_CONNECTION, WRITE_DATABASE_PRAGMAS)
+    await execute_statements(
+        DATABASE_CONNECTION,
+        (
+            """
+            CREATE TABLE IF NOT EXISTS bookings (
+                id INTEGER PRIMARY KEY,
+                start_time INTEGER NOT NULL,
+                end_time INTEGER NOT NULL,
+                description TEXT NOT NULL,
+                user_id TEXT NOT NULL
+            )
+            """,
+            """
+            CREATE INDEX IF NOT EXISTS idx_bookings_start_end_description
+            ON bookings (start_time, end_time, description)
+            """,
+            """
+            CREATE INDEX IF NOT EXISTS idx_bookings_end_start_description
+            ON bookings (end_time, start_time, description)
+            """,
+            """
+            CREATE INDEX IF NOT EXISTS idx_bookings_user_end
+            ON bookings (user_id, end_time)
+            """,
+            "ANALYZE",
+        ),
     )
-    DATABASE_CONNECTION.commit()
+    await DATABASE_CONNECTION.commit()
 
 
 async def websocket_connection_handler(websocket) -> None:
     """This function handles the WebSocket connection.
-    It sends an update to the connected screen every 10 seconds.
+    It registers the connected screen so it receives the booking updates until it disconnects.
 
     Args:
         websocket: Websocket client instance
     """
     print("Screen has connected :)")
+    CONNECTED_SCREENS.add(websocket)
+    try:
+        if LAST_SCREEN_PAYLOAD is not None:
+            await websocket.send(LAST_SCREEN_PAYLOAD)
+
+        await websocket.wait_closed()
+
+    except websockets.exceptions.ConnectionClosed:
+        pass
+
+    finally:
+        CONNECTED_SCREENS.discard(websocket)
+        print("Screen has disconnected :(")
+
+
+async def broadcast_bookings_to_screens() -> None:
+    """Sends the current bookings to all connected screens whenever the bookings change.
+    Also updates every 60 seconds, so the screens catch a booking becoming the current one.
+    The bookings are only queried once per update, and only encoded and sent when they changed.
+    """
+    global LAST_SCREEN_PAYLOAD
+    last_bookings_key = None
     while True:
+        BOOKINGS_CHANGED.clear()
         try:
             current_three_bookings = await get_current_three_bookings()
-            json_to_send = await bookings_to_view_json(current_three_bookings)
 
-            await websocket.send(json_to_send)
+            current_timestamp = int(datetime.now().timestamp())
+            bookings_key = tuple(
+                (booking, is_current_booking(booking[1], booking[2], current_timestamp))
+                for booking in current_three_bookings
+            )
+            if bookings_key != last_bookings_key:
+                LAST_SCREEN_PAYLOAD = await bookings_to_view_json(
+                    current_three_bookings, current_timestamp
+                )
+                last_bookings_key = bookings_key
+                websockets.broadcast(CONNECTED_SCREENS, LAST_SCREEN_PAYLOAD)
 
-        except websockets.exceptions.ConnectionClosed:
-            print("Screen has disconnected :(")
-            return
+        except Exception as error:
+            print(f"Failed to update the screens: {error}")
 
-        await asyncio.sleep(10)
+        try:
+            await asyncio.wait_for(BOOKINGS_CHANGED.wait(), timeout=60)
+        except asyncio.TimeoutError:
+            pass
 
 
 async def start_websocket_server() -> None:
@@ -663,12 +860,18 @@ async def start_bolt_app() -> None:
 
 
 async def start_program() -> None:
-    """Asynchronously starts the websocket server and bolt app."""
-    await create_bookings_table()
-    await asyncio.gather(
-        start_websocket_server(),
-        start_bolt_app(),
-    )
+    """Asynchronously starts the websocket server, screen broadcaster and bolt app."""
+    try:
+        await open_database_connection()
+        await create_bookings_table()
+        await open_read_database_connection()
+        await asyncio.gather(
+            start_websocket_server(),
+            broadcast_bookings_to_screens(),
+            start_bolt_app(),
+        )
+    finally:
+        await close_database_connections()
 
 
 if __name__ == "__main__":